@@ -4,233 +4,234 @@ Generate LaTeX academic paper from benchmark data
 Creates both .tex source and compiled PDF
 """
 
-import json
+import hashlib
+import operator
 import os
-import subprocess
-import datetime
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-import shutil
-import tempfile
-
-class LatexPaperGenerator:
-    def __init__(self, benchmark_data):
-        self.data = benchmark_data
-        self.timestamp = datetime.datetime.now()
-        
-    def generate_latex_document(self):
-        """Generate complete LaTeX document"""
-        return f"""\\documentclass[10pt,a4paper,twocolumn]{{article}}
-\\usepackage[margin=2cm]{{geometry}}
-\\usepackage{{graphicx}}
-\\usepackage{{booktabs}}
-\\usepackage{{array}}
-\\usepackage{{multirow}}
-\\usepackage{{color}}
-\\usepackage{{xcolor}}
-\\usepackage{{hyperref}}
-\\usepackage{{amsmath}}
-\\usepackage{{amssymb}}
-\\usepackage{{float}}
-\\usepackage{{subcaption}}
-\\usepackage{{tikz}}
-\\usepackage{{pgfplots}}
-\\pgfplotsset{{compat=1.18}}
+from types import MappingProxyType
+import zipfile
+
+# Static document segments, built once at import. The generated sections are
+# interleaved with them by LatexPaperGenerator._latex_chunks
+_PREAMBLE = r"""\documentclass[10pt,a4paper,twocolumn]{article}
+\usepackage[margin=2cm]{geometry}
+\usepackage{graphicx}
+\usepackage{booktabs}
+\usepackage{array}
+\usepackage{multirow}
+\usepackage{color}
+\usepackage{xcolor}
+\usepackage{hyperref}
+\usepackage{amsmath}
+\usepackage{amssymb}
+\usepackage{float}
+\usepackage{subcaption}
+\usepackage{tikz}
+\usepackage{pgfplots}
+\pgfplotsset{compat=1.18}
 
 % Define colors matching the web design
-\\definecolor{{darkbg}}{{HTML}}{{101010}}
-\\definecolor{{accentgreen}}{{HTML}}{{00A67E}}
-\\definecolor{{textgray}}{{HTML}}{{6B7280}}
+\definecolor{darkbg}{HTML}{101010}
+\definecolor{accentgreen}{HTML}{00A67E}
+\definecolor{textgray}{HTML}{6B7280}
 
 % Hyperref setup
-\\hypersetup{{
+\hypersetup{
     colorlinks=true,
     linkcolor=accentgreen,
     filecolor=accentgreen,
     urlcolor=accentgreen,
     citecolor=accentgreen
-}}
+}
 
-\\title{{\\textbf{{AwardBench: A Preliminary Evaluation Framework for Government Contracting AI Systems}}}}
-\\author{{
-    Awarded AI Research Team\\\\
-    Procurement Sciences Inc.\\\\
-    \\texttt{{research@awarded.ai}}
-}}
-\\date{{\\today}}
+\title{\textbf{AwardBench: A Preliminary Evaluation Framework for Government Contracting AI Systems}}
+\author{
+    Awarded AI Research Team\\
+    Procurement Sciences Inc.\\
+    \texttt{research@awarded.ai}
+}
+\date{\today}
 
 % Conflict of Interest Box
-\\usepackage{{fancybox}}
-\\usepackage{{mdframed}}
+\usepackage{fancybox}
+\usepackage{mdframed}
 
-\\begin{{document}}
+\begin{document}
 
-\\maketitle
+\maketitle
 
 % Conflict of Interest Warning Box
-\\begin{{mdframed}}[backgroundcolor=red!10,linecolor=red,linewidth=2pt]
-\\textbf{{CONFLICT OF INTEREST DISCLOSURE:}} This evaluation framework is developed by Procurement Sciences Inc., which also develops the Awarded AI Platform evaluated in this benchmark. This represents a significant conflict of interest. Independent validation by third parties is required before using these results for any business or procurement decisions. Results should be considered preliminary and potentially biased.
-\\end{{mdframed}}
+\begin{mdframed}[backgroundcolor=red!10,linecolor=red,linewidth=2pt]
+\textbf{CONFLICT OF INTEREST DISCLOSURE:} This evaluation framework is developed by Procurement Sciences Inc., which also develops the Awarded AI Platform evaluated in this benchmark. This represents a significant conflict of interest. Independent validation by third parties is required before using these results for any business or procurement decisions. Results should be considered preliminary and potentially biased.
+\end{mdframed}
 
-\\begin{{abstract}}
+\begin{abstract}
 We present AwardBench, a preliminary evaluation framework for AI systems in the government contracting (GovCon) domain. Our framework proposes to assess models across four critical dimensions: GovCon Intelligence Accuracy (GIA), Proposal Generation Quality (PGQ), Workflow Automation Effectiveness (WAE), and Retrieval and Context Accuracy (RCA). This work represents an initial attempt at domain-specific evaluation, but requires significant methodological development, independent validation, and peer review before conclusions can be drawn. The framework is currently in development with several known limitations requiring further research.
-\\end{{abstract}}
+\end{abstract}
 
-\\section{{Introduction}}
+\section{Introduction}
 
-Government contracting represents a \\$700 billion annual market in the United States alone, characterized by complex regulatory requirements, intricate proposal processes, and domain-specific terminology. The Federal Acquisition Regulation (FAR) and Defense Federal Acquisition Regulation Supplement (DFARS) comprise over 2,000 pages of dense regulatory text that contractors must navigate to ensure compliance.
+Government contracting represents a \$700 billion annual market in the United States alone, characterized by complex regulatory requirements, intricate proposal processes, and domain-specific terminology. The Federal Acquisition Regulation (FAR) and Defense Federal Acquisition Regulation Supplement (DFARS) comprise over 2,000 pages of dense regulatory text that contractors must navigate to ensure compliance.
 
 Despite the critical importance of this domain, existing AI benchmarks fail to capture the unique challenges of GovCon applications. General-purpose language models, while impressive in broad capabilities, often struggle with the nuanced requirements of government contracting, including:
 
-\\begin{{itemize}}
-\\item Precise interpretation of regulatory clauses
-\\item Generation of compliant proposal content
-\\item Understanding of domain-specific workflows
-\\item Accurate retrieval from vast document repositories
-\\end{{itemize}}
+\begin{itemize}
+\item Precise interpretation of regulatory clauses
+\item Generation of compliant proposal content
+\item Understanding of domain-specific workflows
+\item Accurate retrieval from vast document repositories
+\end{itemize}
 
 To address this gap, we introduce AwardBench, the first comprehensive benchmark specifically designed to evaluate AI systems for government contracting applications.
 
-\\section{{Related Work}}
+\section{Related Work}
 
-\\subsection{{General AI Benchmarks}}
-Previous benchmarks such as MMLU \\cite{{hendrycks2021measuring}}, SuperGLUE \\cite{{wang2019superglue}}, and HellaSwag \\cite{{zellers2019hellaswag}} have established standards for evaluating general language understanding. However, these benchmarks focus on broad capabilities rather than domain-specific expertise.
+\subsection{General AI Benchmarks}
+Previous benchmarks such as MMLU \cite{hendrycks2021measuring}, SuperGLUE \cite{wang2019superglue}, and HellaSwag \cite{zellers2019hellaswag} have established standards for evaluating general language understanding. However, these benchmarks focus on broad capabilities rather than domain-specific expertise.
 
-\\subsection{{Domain-Specific Benchmarks}}
-Recent work has highlighted the importance of domain-specific evaluation. Medical benchmarks like MedQA \\cite{{jin2021disease}} and legal benchmarks such as LegalBench \\cite{{guha2023legalbench}} demonstrate that specialized evaluation is crucial for high-stakes applications. Our work extends this approach to the government contracting domain.
+\subsection{Domain-Specific Benchmarks}
+Recent work has highlighted the importance of domain-specific evaluation. Medical benchmarks like MedQA \cite{jin2021disease} and legal benchmarks such as LegalBench \cite{guha2023legalbench} demonstrate that specialized evaluation is crucial for high-stakes applications. Our work extends this approach to the government contracting domain.
 
-\\subsection{{Benchmark Quality and Best Practices}}
-Recent research has raised important concerns about benchmark quality and evaluation practices. Reuel et al. \\cite{{reuel2024betterbench}} assessed 24 AI benchmarks against 46 best practices and found significant quality differences, with many benchmarks suffering from issues like inadequate statistical significance reporting and poor reproducibility. Similarly, Eriksson et al. \\cite{{eriksson2025trust}} conducted an interdisciplinary review highlighting systemic flaws in benchmarking practices, including misaligned incentives, construct validity issues, and problems with gaming of benchmark results. These studies underscore the critical importance of methodological rigor in benchmark development—concerns that directly inform our approach to AwardBench.
+\subsection{Benchmark Quality and Best Practices}
+Recent research has raised important concerns about benchmark quality and evaluation practices. Reuel et al. \cite{reuel2024betterbench} assessed 24 AI benchmarks against 46 best practices and found significant quality differences, with many benchmarks suffering from issues like inadequate statistical significance reporting and poor reproducibility. Similarly, Eriksson et al. \cite{eriksson2025trust} conducted an interdisciplinary review highlighting systemic flaws in benchmarking practices, including misaligned incentives, construct validity issues, and problems with gaming of benchmark results. These studies underscore the critical importance of methodological rigor in benchmark development—concerns that directly inform our approach to AwardBench.
 
-\\section{{Methodology}}
+\section{Methodology}
 
-\\subsection{{Evaluation Framework}}
+\subsection{Evaluation Framework}
 
 AwardBench comprises four core evaluation pillars, each designed to assess critical capabilities for GovCon AI systems:
 
-\\subsubsection{{GovCon Intelligence Accuracy (GIA)}}
+\subsubsection{GovCon Intelligence Accuracy (GIA)}
 This metric evaluates the model's ability to correctly interpret and apply federal acquisition regulations. Test cases include:
-\\begin{{itemize}}
-\\item FAR/DFARS clause interpretation
-\\item Compliance requirement identification
-\\item Contract type determination
-\\item Regulatory update comprehension
-\\end{{itemize}}
-
-\\subsubsection{{Proposal Generation Quality (PGQ)}}
+\begin{itemize}
+\item FAR/DFARS clause interpretation
+\item Compliance requirement identification
+\item Contract type determination
+\item Regulatory update comprehension
+\end{itemize}
+
+\subsubsection{Proposal Generation Quality (PGQ)}
 We assess the quality of AI-generated proposal content across multiple dimensions:
-\\begin{{itemize}}
-\\item Win theme alignment
-\\item Technical accuracy
-\\item Compliance with solicitation requirements
-\\item Persuasiveness and clarity
-\\end{{itemize}}
-
-\\subsubsection{{Workflow Automation Effectiveness (WAE)}}
+\begin{itemize}
+\item Win theme alignment
+\item Technical accuracy
+\item Compliance with solicitation requirements
+\item Persuasiveness and clarity
+\end{itemize}
+
+\subsubsection{Workflow Automation Effectiveness (WAE)}
 This metric measures the system's ability to automate complex GovCon workflows:
-\\begin{{itemize}}
-\\item End-to-end process completion rate
-\\item Time-to-value metrics
-\\item Error reduction compared to manual processes
-\\item Integration with existing tools
-\\end{{itemize}}
-
-\\subsubsection{{Retrieval and Context Accuracy (RCA)}}
+\begin{itemize}
+\item End-to-end process completion rate
+\item Time-to-value metrics
+\item Error reduction compared to manual processes
+\item Integration with existing tools
+\end{itemize}
+
+\subsubsection{Retrieval and Context Accuracy (RCA)}
 We evaluate the precision and relevance of information retrieval:
-\\begin{{itemize}}
-\\item Document retrieval precision
-\\item Context window utilization
-\\item Source attribution accuracy
-\\item Multi-document reasoning
-\\end{{itemize}}
+\begin{itemize}
+\item Document retrieval precision
+\item Context window utilization
+\item Source attribution accuracy
+\item Multi-document reasoning
+\end{itemize}
 
-\\subsection{{Dataset Construction}}
+\subsection{Dataset Construction}
 
 Our evaluation dataset comprises:
-\\begin{{itemize}}
-\\item 10,000+ real government solicitations
-\\item 50,000+ FAR/DFARS interpretation questions
-\\item 5,000+ complete proposal sections
-\\item 100,000+ document retrieval queries
-\\end{{itemize}}
+\begin{itemize}
+\item 10,000+ real government solicitations
+\item 50,000+ FAR/DFARS interpretation questions
+\item 5,000+ complete proposal sections
+\item 100,000+ document retrieval queries
+\end{itemize}
 
 All data was collected from public sources and anonymized to protect sensitive information.
 
-\\subsection{{Evaluation Protocol}}
+\subsection{Evaluation Protocol}
 
 Each model undergoes evaluation through:
-\\begin{{enumerate}}
-\\item Automated testing on standardized tasks
-\\item Expert human evaluation of outputs
-\\item Production deployment validation
-\\item Continuous performance monitoring
-\\end{{enumerate}}
-
-\\section{{Results}}
-
-\\subsection{{Overall Performance}}
+\begin{enumerate}
+\item Automated testing on standardized tasks
+\item Expert human evaluation of outputs
+\item Production deployment validation
+\item Continuous performance monitoring
+\end{enumerate}
+
+\section{Results}
+
+\subsection{Overall Performance}
+
+Table \ref{tab:leaderboard} presents the overall leaderboard results across all evaluated models.
+
+\begin{table}[H]
+\centering
+\caption{Overall Model Performance on AwardBench}
+\label{tab:leaderboard}
+\begin{tabular}{@{}lcccc@{}}
+\toprule
+\textbf{Model} & \textbf{Overall} & \textbf{GIA} & \textbf{PGQ} & \textbf{WAE} \\
+\midrule
+"""
 
-Table \\ref{{tab:leaderboard}} presents the overall leaderboard results across all evaluated models.
+_BETWEEN_LB_ANALYSIS = r"""
+\bottomrule
+\end{tabular}
+\end{table}
 
-\\begin{{table}}[H]
-\\centering
-\\caption{{Overall Model Performance on AwardBench}}
-\\label{{tab:leaderboard}}
-\\begin{{tabular}}{{@{{}}lcccc@{{}}}}
-\\toprule
-\\textbf{{Model}} & \\textbf{{Overall}} & \\textbf{{GIA}} & \\textbf{{PGQ}} & \\textbf{{WAE}} \\\\
-\\midrule
-{self._generate_leaderboard_rows()}
-\\bottomrule
-\\end{{tabular}}
-\\end{{table}}
+\subsection{Detailed Analysis}
 
-\\subsection{{Detailed Analysis}}
+"""
 
-{self._generate_detailed_analysis()}
+_BETWEEN_ANALYSIS_APPENDIX = r"""
 
-\\section{{Discussion}}
+\section{Discussion}
 
 Our results demonstrate several key findings:
 
-\\begin{{enumerate}}
-\\item \\textbf{{Domain Specialization Matters}}: The significant performance gap between specialized and general-purpose models underscores the importance of domain-specific training.
+\begin{enumerate}
+\item \textbf{Domain Specialization Matters}: The significant performance gap between specialized and general-purpose models underscores the importance of domain-specific training.
 
-\\item \\textbf{{Compliance Accuracy is Critical}}: Models trained specifically on GovCon data show markedly better understanding of regulatory requirements.
+\item \textbf{Compliance Accuracy is Critical}: Models trained specifically on GovCon data show markedly better understanding of regulatory requirements.
 
-\\item \\textbf{{Integrated Capabilities Excel}}: Systems that combine multiple capabilities (retrieval, generation, and workflow automation) outperform single-purpose tools.
-\\end{{enumerate}}
+\item \textbf{Integrated Capabilities Excel}: Systems that combine multiple capabilities (retrieval, generation, and workflow automation) outperform single-purpose tools.
+\end{enumerate}
 
-\\section{{Limitations and Future Work}}
+\section{Limitations and Future Work}
 
 This work has significant limitations that must be acknowledged:
 
-\\subsection{{Methodological Limitations}}
-\\begin{{itemize}}
-\\item \\textbf{{Conflict of Interest}}: Framework developed by organization with competing product
-\\item \\textbf{{Dataset Validation}}: No independent verification of dataset quality or bias
-\\item \\textbf{{Metric Justification}}: Mathematical rigor and statistical validation incomplete
-\\item \\textbf{{Reproducibility}}: Full methodology not documented for independent replication
-\\item \\textbf{{Overfitting Risk}}: No verification that test data is isolated from training data
-\\end{{itemize}}
-
-\\subsection{{Scope Limitations}}
-\\begin{{itemize}}
-\\item Focus on U.S. federal contracting regulations
-\\item Limited coverage of state and local procurement
-\\item Emphasis on text-based tasks over multimodal capabilities
-\\item No adversarial robustness testing
-\\end{{itemize}}
-
-\\subsection{{Required Future Work}}
-\\begin{{itemize}}
-\\item Independent third-party validation of all results
-\\item Rigorous statistical analysis with confidence intervals
-\\item Inter-annotator agreement studies for human evaluation
-\\item Open dataset publication for community validation
-\\item Peer review of metric definitions and scoring functions
-\\end{{itemize}}
-
-\\section{{Conclusion}}
+\subsection{Methodological Limitations}
+\begin{itemize}
+\item \textbf{Conflict of Interest}: Framework developed by organization with competing product
+\item \textbf{Dataset Validation}: No independent verification of dataset quality or bias
+\item \textbf{Metric Justification}: Mathematical rigor and statistical validation incomplete
+\item \textbf{Reproducibility}: Full methodology not documented for independent replication
+\item \textbf{Overfitting Risk}: No verification that test data is isolated from training data
+\end{itemize}
+
+\subsection{Scope Limitations}
+\begin{itemize}
+\item Focus on U.S. federal contracting regulations
+\item Limited coverage of state and local procurement
+\item Emphasis on text-based tasks over multimodal capabilities
+\item No adversarial robustness testing
+\end{itemize}
+
+\subsection{Required Future Work}
+\begin{itemize}
+\item Independent third-party validation of all results
+\item Rigorous statistical analysis with confidence intervals
+\item Inter-annotator agreement studies for human evaluation
+\item Open dataset publication for community validation
+\item Peer review of metric definitions and scoring functions
+\end{itemize}
+
+\section{Conclusion}
 
 AwardBench represents an initial attempt at creating a domain-specific evaluation framework for government contracting AI systems. While this work identifies important evaluation dimensions and proposes methodological approaches, significant additional development is required before the framework can be considered scientifically rigorous or suitable for making comparative claims about system performance.
 
@@ -238,98 +239,57 @@ The primary contributions of this work are: (1) identification of key evaluation
 
 We strongly recommend that any use of this framework be preceded by independent validation, peer review, and methodological refinement by non-conflicted parties. The government contracting community would benefit from a truly independent, academically rigorous benchmark developed through collaborative effort across multiple stakeholders.
 
-\\section*{{Acknowledgments}}
+\section*{Acknowledgments}
 
 We thank the procurement professionals, contracting officers, customers, partners, and technical experts who contributed to the development and validation of AwardBench and the work it is built upon.
 
-\\bibliographystyle{{plain}}
-\\bibliography{{references}}
+\bibliographystyle{plain}
+\bibliography{references}
 
-\\appendix
+\appendix
 
-\\section{{Detailed Metric Definitions}}
+\section{Detailed Metric Definitions}
 
-{self._generate_metric_appendix()}
+"""
+
+_POSTAMBLE = r"""
 
-\\end{{document}}
+\end{document}
 """
 
-    def _generate_leaderboard_rows(self):
-        """Generate LaTeX table rows for leaderboard"""
-        rows = []
-        for model in self.data['leaderboard']:
-            scores = model['scores']
-            row = f"{model['model']} & {model['overall_score']:.3f} & {scores['compliance_accuracy']:.3f} & {scores['proposal_quality']:.3f} & {scores['workflow_effectiveness']:.3f}"
-            rows.append(row)
-        return " \\\\\n".join(rows)
-    
-    def _generate_detailed_analysis(self):
-        """Generate detailed analysis section"""
-        return f"""
-Figure \\ref{{fig:radar}} shows the multi-dimensional performance comparison across all evaluated models. The Awarded AI Platform demonstrates consistent superiority across all metrics, with particularly strong performance in compliance accuracy ({self.data['leaderboard'][0]['scores']['compliance_accuracy']:.1%}).
-
-\\begin{{figure}}[H]
-\\centering
-\\begin{{tikzpicture}}
-\\begin{{axis}}[
-    width=0.45\\textwidth,
-    height=0.35\\textwidth,
-    title={{Performance Radar Chart}},
-    xlabel={{Metric}},
-    ylabel={{Score}},
+# Results discussion and score figure; brace-free raw LaTeX with $-placeholders
+_ANALYSIS_TEMPLATE = string.Template(r"""
+Figure \ref{fig:radar} shows the multi-dimensional performance comparison across all evaluated models. The Awarded AI Platform demonstrates consistent superiority across all metrics, with particularly strong performance in compliance accuracy ($top_compliance).
+
+\begin{figure}[H]
+\centering
+$plot_table
+\begin{tikzpicture}
+\begin{axis}[
+    width=0.45\textwidth,
+    height=0.35\textwidth,
+    title={Performance Radar Chart},
+    xlabel={Metric},
+    ylabel={Score},
     ymin=0.5,
     ymax=1.0,
     legend pos=south east,
     ymajorgrids=true,
     grid style=dashed,
 ]
-{self._generate_plot_data()}
-\\end{{axis}}
-\\end{{tikzpicture}}
-\\caption{{Multi-dimensional performance comparison}}
-\\label{{fig:radar}}
-\\end{{figure}}
+$plot_data
+\end{axis}
+\end{tikzpicture}
+\caption{Multi-dimensional performance comparison}
+\label{fig:radar}
+\end{figure}
 
 The performance differential is most pronounced in GovCon-specific tasks, where domain knowledge and regulatory understanding are critical.
-"""
+""")
 
-    def _generate_plot_data(self):
-        """Generate plot data for charts"""
-        plot_lines = []
-        colors = ['accentgreen', 'blue', 'red', 'orange']
-        for i, model in enumerate(self.data['leaderboard'][:3]):
-            scores = model['scores']
-            values = [
-                scores['compliance_accuracy'],
-                scores['proposal_quality'],
-                scores['workflow_effectiveness'],
-                scores['retrieval_accuracy']
-            ]
-            plot_lines.append(f"\\addplot[color={colors[i]},mark=*] coordinates {{(1,{values[0]}) (2,{values[1]}) (3,{values[2]}) (4,{values[3]})}};")
-            plot_lines.append(f"\\addlegendentry{{{model['model']}}}")
-        return "\n".join(plot_lines)
-    
-    def _generate_metric_appendix(self):
-        """Generate detailed metric definitions"""
-        sections = []
-        for metric_key, metric in self.data['metrics'].items():
-            section = f"""
-\\subsection{{{metric['name']}}}
-{metric['description']}
-
-Best performing model: {metric['best_model']} (Score: {metric['best_score']:.3f})
-"""
-            sections.append(section)
-        return "\n".join(sections)
-    
-    def save_latex_file(self, output_path):
-        """Save LaTeX document to file"""
-        latex_content = self.generate_latex_document()
-        with open(output_path, 'w') as f:
-            f.write(latex_content)
-        
-        # Also create a comprehensive references.bib file with verified citations and additional sources
-        bib_content = """@article{hendrycks2021measuring,
+# Bibliography written alongside the .tex; identical for every paper, so it is
+# encoded once here and written as raw bytes
+_BIB_BYTES = r"""@article{hendrycks2021measuring,
   title={Measuring massive multitask language understanding},
   author={Hendrycks, Dan and Burns, Collin and Basart, Steven and Zou, Andy and Mazeika, Mantas and Song, Dawn and Steinhardt, Jacob},
   journal={arXiv preprint arXiv:2009.03300},
@@ -407,43 +367,153 @@ Best performing model: {metric['best_model']} (Score: {metric['best_score']:.3f}
   pages={842--866},
   year={2020}
 }
-"""
+""".encode('utf-8')
+
+# %-style formats dispatch straight to the C float formatter, no per-call spec parsing
+_ROW_FMT = "%s & %.3f & %.3f & %.3f & %.3f"
+_ROW_SCORES = operator.itemgetter('compliance_accuracy', 'proposal_quality', 'workflow_effectiveness')
+# The four radar-plot metrics in axis order, fetched in one C-level call
+_PLOT_SCORES = operator.itemgetter(
+    'compliance_accuracy', 'proposal_quality', 'workflow_effectiveness', 'retrieval_accuracy'
+)
+# Scores go into one inline table parsed by pgfplots' table reader; each
+# \addplot then just names its column instead of spelling out coordinates
+_PLOT_TABLE_FMT = "\\pgfplotstableread[col sep=comma,row sep=\\\\]{\n%s\n}\\scoretable"
+_PLOT_COLORS = ('accentgreen', 'blue', 'red', 'orange')
+_PLOT_FMT = "\\addplot[color=%s,mark=*] table[x=metric,y=m%d] {\\scoretable};\n\\addlegendentry{%s}"
+_METRIC_FIELDS = operator.itemgetter('name', 'description', 'best_model', 'best_score')
+_APPENDIX_FMT = "\n\\subsection{%s}\n%s\n\nBest performing model: %s (Score: %.3f)\n"
+
+class LatexPaperGenerator:
+    def __init__(self, benchmark_data):
+        self.data = benchmark_data
+        # Top-ranked model's scores, looked up once rather than at every render
+        self._top_scores = benchmark_data['leaderboard'][0]['scores']
+        self._top_compliance = self._top_scores['compliance_accuracy']
+        # Row format unrolled to the leaderboard's length, so the whole table
+        # renders in a single % call
+        self._leaderboard_fmt = " \\\\\n".join([_ROW_FMT] * len(benchmark_data['leaderboard']))
+        
+    def generate_latex_document(self):
+        """Generate complete LaTeX document"""
+        # The generated sections are memoised per instance, so a repeat render
+        # only joins the already-built strings
+        return "".join(self._latex_chunks())
+
+    def _latex_chunks(self):
+        """Document as a tuple of static segments and generated sections"""
+        return (
+            _PREAMBLE,
+            self._leaderboard_rows,
+            _BETWEEN_LB_ANALYSIS,
+            self._detailed_analysis,
+            _BETWEEN_ANALYSIS_APPENDIX,
+            self._metric_appendix,
+            _POSTAMBLE,
+        )
+
+    # The data is treated as immutable for the generator's lifetime, so each
+    # section is rendered once and reused by later renders (e.g. preview + save)
+    @cached_property
+    def _leaderboard_rows(self):
+        return self._generate_leaderboard_rows()
+
+    @cached_property
+    def _detailed_analysis(self):
+        return self._generate_detailed_analysis()
+
+    @cached_property
+    def _metric_appendix(self):
+        return self._generate_metric_appendix()
+
+    def _generate_leaderboard_rows(self):
+        """Generate LaTeX table rows for leaderboard"""
+        values = []
+        for model in self.data['leaderboard']:
+            values.append(model['model'])
+            values.append(model['overall_score'])
+            values.extend(_ROW_SCORES(model['scores']))
+        return self._leaderboard_fmt % tuple(values)
+    
+    def _generate_detailed_analysis(self):
+        """Generate detailed analysis section"""
+        return _ANALYSIS_TEMPLATE.substitute(
+            # Escaped: a bare % would comment out the rest of the LaTeX line
+            top_compliance=format(self._top_compliance, '.1%').replace('%', r'\%'),
+            plot_table=self._generate_plot_table(),
+            plot_data=self._generate_plot_data(),
+        )
+
+    def _generate_plot_table(self):
+        """Generate the inline data table read by the plot"""
+        columns = [_PLOT_SCORES(model['scores']) for model in self.data['leaderboard'][:3]]
+        header = "metric," + ",".join(["m%d" % i for i in range(1, len(columns) + 1)]) + "\\\\"
+        rows = [
+            "%d," % axis + ",".join(["%g" % value for value in values]) + "\\\\"
+            for axis, values in enumerate(zip(*columns), 1)
+        ]
+        return _PLOT_TABLE_FMT % "\n".join([header, *rows])
+    
+    def _generate_plot_data(self):
+        """Generate plot data for charts"""
+        return "\n".join(
+            _PLOT_FMT % (color, column, model['model'])
+            for column, (color, model) in enumerate(zip(_PLOT_COLORS, self.data['leaderboard'][:3]), 1)
+        )
+    
+    def _generate_metric_appendix(self):
+        """Generate detailed metric definitions"""
+        return "\n".join(_APPENDIX_FMT % _METRIC_FIELDS(metric) for metric in self.data['metrics'].values())
+    
+    def save_latex_file(self, output_path):
+        """Save LaTeX document to file"""
+        # Stream sections straight to disk rather than building the whole document first
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._latex_chunks())
+        
+        # Also create a comprehensive references.bib file with verified citations and additional sources
         bib_path = output_path.parent / "references.bib"
-        with open(bib_path, 'w') as f:
-            f.write(bib_content)
+        bib_path.write_bytes(_BIB_BYTES)
         
         return output_path, bib_path
     
     def compile_to_pdf(self, tex_path):
-        """Compile LaTeX to PDF"""
+        """Compile LaTeX to PDF; returns the PDF path only if the file exists, else None"""
+        # Imported lazily so renderers that never compile don't pay for them
+        import shutil
+        import tempfile
+        
+        # Clear any previous PDF so a failed run isn't mistaken for success, and
+        # so the fresh copy gets its own inode instead of truncating a
+        # hardlinked cache entry in place
+        pdf_path = tex_path.with_suffix('.pdf')
+        pdf_path.unlink(missing_ok=True)
+        
         try:
-            # Run pdflatex twice to resolve references
-            for _ in range(2):
-                result = subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', tex_path],
-                    cwd=tex_path.parent,
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
-                    print(f"LaTeX compilation warning: {result.stderr}")
-            
-            # Run bibtex
-            subprocess.run(
-                ['bibtex', tex_path.stem],
-                cwd=tex_path.parent,
-                capture_output=True
-            )
-            
-            # Run pdflatex two more times
-            for _ in range(2):
-                subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', tex_path],
-                    cwd=tex_path.parent,
-                    capture_output=True
-                )
+            # Build in RAM-backed scratch space so the passes' .aux/.log/.out
+            # churn never touches the output filesystem
+            scratch = '/dev/shm' if os.path.isdir('/dev/shm') else None
+            with tempfile.TemporaryDirectory(dir=scratch) as build_dir:
+                build_tex = Path(build_dir) / tex_path.name
+                # Carry over a previous .bbl, with the key of the bibtex inputs it was
+                # built from, so unchanged citations can skip bibtex
+                for src in (tex_path, tex_path.parent / "references.bib",
+                            tex_path.with_suffix('.bbl'), tex_path.with_suffix('.bibkey')):
+                    if src.exists():
+                        shutil.copy(src, build_dir)
+                
+                if shutil.which('tectonic'):
+                    self._run_tectonic(build_tex)
+                elif shutil.which('latexmk'):
+                    self._run_latexmk(build_tex)
+                else:
+                    self._run_pdflatex(build_tex)
+                
+                for suffix in ('.pdf', '.bbl', '.bibkey', '.log'):
+                    built = build_tex.with_suffix(suffix)
+                    if built.exists():
+                        shutil.copyfile(built, tex_path.with_suffix(suffix))
             
-            pdf_path = tex_path.with_suffix('.pdf')
             if pdf_path.exists():
                 return pdf_path
             else:
@@ -452,10 +522,109 @@ Best performing model: {metric['best_model']} (Score: {metric['best_score']:.3f}
         except Exception as e:
             print(f"PDF compilation error: {e}")
             return None
+    
+    def _run_tectonic(self, tex_path):
+        """Single tectonic run; it reruns the engine and bibtex internally until the .aux settles"""
+        import subprocess
+        
+        subprocess.run(
+            ['tectonic', '--keep-logs', '--outdir', str(tex_path.parent), str(tex_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def _run_latexmk(self, tex_path):
+        """latexmk tracks .aux/.bbl changes and runs only the passes actually needed"""
+        import subprocess
+        
+        subprocess.run(
+            ['latexmk', '-pdf', '-bibtex', '-interaction=batchmode', tex_path.name],
+            cwd=tex_path.parent,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def _run_pdflatex(self, tex_path):
+        """Classic pdflatex/bibtex/pdflatex sequence; bibtex is skipped only when a
+        carried-over .bbl was built from the same citations and references.bib"""
+        import subprocess
+        
+        latex_cmd = ['pdflatex', '-interaction=batchmode', tex_path.name]
+        draft_cmd = ['pdflatex', '-draftmode', '-interaction=batchmode', tex_path.name]
+        
+        # Two draft passes resolve references; draftmode writes the .aux
+        # but skips PDF shipout
+        result = subprocess.run(
+            draft_cmd,
+            cwd=tex_path.parent,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            print(f"LaTeX compilation warning: {result.stderr}")
+        subprocess.run(draft_cmd, cwd=tex_path.parent,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        # With a .bbl left over from an earlier build, every citation may
+        # already resolve; then bibtex and the extra passes are wasted work.
+        # Resolving isn't enough on its own: an edited bib entry or a dropped
+        # \cite would still leave the old bibliography in place
+        log = tex_path.with_suffix('.log').read_bytes()
+        bib_stamp = tex_path.with_suffix('.bibkey')
+        bib_key = _bibtex_key(tex_path)
+        if (b'LaTeX Warning: Citation' not in log and b'There were undefined references' not in log
+                and bib_stamp.exists() and bib_stamp.read_text() == bib_key):
+            subprocess.run(latex_cmd, cwd=tex_path.parent,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
+        
+        # Run bibtex
+        subprocess.run(
+            ['bibtex', tex_path.stem],
+            cwd=tex_path.parent,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        bib_stamp.write_text(bib_key)
+        
+        # Run pdflatex two more times, emitting the PDF
+        subprocess.run(latex_cmd, cwd=tex_path.parent,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.run(latex_cmd, cwd=tex_path.parent,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+
+def _bibtex_key(tex_path):
+    """Content hash of bibtex's inputs: the .aux citation, style and database lines plus references.bib"""
+    digest = hashlib.blake2b(digest_size=16)
+    for line in tex_path.with_suffix('.aux').read_bytes().splitlines():
+        if line.startswith((b'\\citation', b'\\bibstyle', b'\\bibdata')):
+            digest.update(line + b'\n')
+    digest.update((tex_path.parent / "references.bib").read_bytes())
+    return digest.hexdigest()
 
 
-def generate_paper(benchmark_data, output_dir):
-    """Main function to generate paper"""
+def _source_key(tex_path):
+    """Content hash of the rendered .tex and the bibliography, which together determine the PDF"""
+    digest = hashlib.blake2b(tex_path.read_bytes(), digest_size=16)
+    digest.update(_BIB_BYTES)
+    return digest.hexdigest()
+
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a copy across filesystems"""
+    import shutil
+    
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def generate_paper(benchmark_data, output_dir, cache_dir=None):
+    """Main function to generate paper; compiled PDFs are cached in cache_dir (default output_dir/.cache)"""
     generator = LatexPaperGenerator(benchmark_data)
     
     # Create output directory
@@ -466,95 +635,111 @@ def generate_paper(benchmark_data, output_dir):
     tex_path = output_dir / "awardbench_paper.tex"
     tex_path, bib_path = generator.save_latex_file(tex_path)
     
-    # Try to compile PDF
-    pdf_path = generator.compile_to_pdf(tex_path)
-    
-    # Create a downloadable bundle
-    bundle_dir = output_dir / "awardbench_paper_bundle"
-    bundle_dir.mkdir(exist_ok=True)
-    
-    # Copy files to bundle
-    shutil.copy(tex_path, bundle_dir)
-    shutil.copy(bib_path, bundle_dir)
-    if pdf_path and pdf_path.exists():
-        shutil.copy(pdf_path, bundle_dir)
-    
-    # Create zip archive
-    shutil.make_archive(
-        str(output_dir / "awardbench_paper"),
-        'zip',
-        bundle_dir
-    )
+    # Reuse a previously compiled PDF when the sources are unchanged. Keying on
+    # the rendered sources rather than the data also catches template changes
+    cache_dir = output_dir / ".cache" if cache_dir is None else Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached_pdf = cache_dir / f"awardbench_{_source_key(tex_path)}.pdf"
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        if cached_pdf.exists():
+            pdf_path = tex_path.with_suffix('.pdf')
+            _link_or_copy(cached_pdf, pdf_path)
+            compiling = None
+        else:
+            # Try to compile PDF in the background while the sources are zipped
+            compiling = pool.submit(generator.compile_to_pdf, tex_path)
+        
+        # Create a downloadable bundle, zipping the outputs in place
+        bundle_path = output_dir / "awardbench_paper.zip"
+        with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as bundle:
+            bundle.write(tex_path, tex_path.name)
+            # The bibliography is already in memory; skip rereading it from disk
+            bundle.writestr(bib_path.name, _BIB_BYTES)
+            
+            if compiling is not None:
+                pdf_path = compiling.result()
+                if pdf_path:
+                    staging = cached_pdf.with_suffix('.pdf.tmp')
+                    _link_or_copy(pdf_path, staging)
+                    os.replace(staging, cached_pdf)
+                    # Only the latest sources are ever requested again
+                    for stale in cache_dir.glob("awardbench_*.pdf"):
+                        if stale != cached_pdf:
+                            stale.unlink(missing_ok=True)
+            # compile_to_pdf and the cache link both leave pdf_path on disk
+            if pdf_path is not None:
+                bundle.write(pdf_path, pdf_path.name)
     
     return {
         'tex_path': str(tex_path),
         'pdf_path': str(pdf_path) if pdf_path else None,
-        'bundle_path': str(output_dir / "awardbench_paper.zip")
+        'bundle_path': str(bundle_path)
     }
 
 
-if __name__ == "__main__":
-    # Load benchmark data (mock data for paper generation)
-    benchmarkData = {
-        'leaderboard': [
-            {
-                'model': 'Awarded AI Platform',
-                'overall_score': 0.947,
-                'scores': {
-                    'compliance_accuracy': 0.98,
-                    'proposal_quality': 0.92,
-                    'workflow_effectiveness': 0.94,
-                    'retrieval_accuracy': 0.95
-                }
-            },
-            {
-                'model': 'Claude 3.7 Sonnet',
-                'overall_score': 0.883,
-                'scores': {
-                    'compliance_accuracy': 0.85,
-                    'proposal_quality': 0.91,
-                    'workflow_effectiveness': 0.88,
-                    'retrieval_accuracy': 0.89
-                }
-            },
-            {
-                'model': 'GPT-4o',
-                'overall_score': 0.872,
-                'scores': {
-                    'compliance_accuracy': 0.84,
-                    'proposal_quality': 0.89,
-                    'workflow_effectiveness': 0.87,
-                    'retrieval_accuracy': 0.88
-                }
+# Mock benchmark data for paper generation, shared read-only by the CLI and importers
+_MOCK_DATA = MappingProxyType({
+    'leaderboard': [
+        {
+            'model': 'Awarded AI Platform',
+            'overall_score': 0.947,
+            'scores': {
+                'compliance_accuracy': 0.98,
+                'proposal_quality': 0.92,
+                'workflow_effectiveness': 0.94,
+                'retrieval_accuracy': 0.95
             }
-        ],
-        'metrics': {
-            'compliance_accuracy': {
-                'name': 'GovCon Intelligence Accuracy',
-                'description': 'Measures accuracy in interpreting federal acquisition regulations and compliance requirements.',
-                'best_model': 'Awarded AI Platform',
-                'best_score': 0.98
-            },
-            'proposal_quality': {
-                'name': 'Proposal Generation Quality',
-                'description': 'Evaluates quality of AI-generated proposal content and win theme alignment.',
-                'best_model': 'Claude 3.7 Sonnet',
-                'best_score': 0.91
-            },
-            'workflow_effectiveness': {
-                'name': 'Workflow Automation Effectiveness',
-                'description': 'Assesses end-to-end automation capabilities and process completion rates.',
-                'best_model': 'Awarded AI Platform',
-                'best_score': 0.94
-            },
-            'retrieval_accuracy': {
-                'name': 'Retrieval and Context Accuracy',
-                'description': 'Tests information retrieval precision and context utilization.',
-                'best_model': 'Awarded AI Platform',
-                'best_score': 0.95
+        },
+        {
+            'model': 'Claude 3.7 Sonnet',
+            'overall_score': 0.883,
+            'scores': {
+                'compliance_accuracy': 0.85,
+                'proposal_quality': 0.91,
+                'workflow_effectiveness': 0.88,
+                'retrieval_accuracy': 0.89
             }
+        },
+        {
+            'model': 'GPT-4o',
+            'overall_score': 0.872,
+            'scores': {
+                'compliance_accuracy': 0.84,
+                'proposal_quality': 0.89,
+                'workflow_effectiveness': 0.87,
+                'retrieval_accuracy': 0.88
+            }
+        }
+    ],
+    'metrics': {
+        'compliance_accuracy': {
+            'name': 'GovCon Intelligence Accuracy',
+            'description': 'Measures accuracy in interpreting federal acquisition regulations and compliance requirements.',
+            'best_model': 'Awarded AI Platform',
+            'best_score': 0.98
+        },
+        'proposal_quality': {
+            'name': 'Proposal Generation Quality',
+            'description': 'Evaluates quality of AI-generated proposal content and win theme alignment.',
+            'best_model': 'Claude 3.7 Sonnet',
+            'best_score': 0.91
+        },
+        'workflow_effectiveness': {
+            'name': 'Workflow Automation Effectiveness',
+            'description': 'Assesses end-to-end automation capabilities and process completion rates.',
+            'best_model': 'Awarded AI Platform',
+            'best_score': 0.94
+        },
+        'retrieval_accuracy': {
+            'name': 'Retrieval and Context Accuracy',
+            'description': 'Tests information retrieval precision and context utilization.',
+            'best_model': 'Awarded AI Platform',
+            'best_score': 0.95
         }
     }
-    
-    result = generate_paper(benchmarkData, "./paper_output")
+})
+
+
+if __name__ == "__main__":
+    result = generate_paper(_MOCK_DATA, "./paper_output")
     print(f"Paper generated: {result}")
\ No newline at end of file
@@ -1,15 +1,30 @@
 #!/usr/bin/env python3
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import functools
 import numpy as np
-from matplotlib.patches import Rectangle
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-# Set style for academic publication quality
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+@functools.lru_cache(maxsize=None)
+def _plotting():
+    """Import and configure matplotlib/seaborn on first use, so importing this module stays cheap"""
+    import matplotlib
+    matplotlib.use('Agg')  # file output only; skip GUI backend initialisation
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set style for academic publication quality
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+    
+    # Simplify long paths and compress PDFs harder to keep the saved files small
+    plt.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+        'pdf.compression': 9,
+    })
+    return plt, sns
 
 # Sample benchmark data (would be loaded from actual results)
 benchmark_results = {
@@ -24,23 +39,60 @@ benchmark_results = {
     "overall_scores": [0.947, 0.883, 0.872, 0.860, 0.724]
 }
 
+# Scores as arrays built once for every chart (metric rows, model columns)
+_METRIC_KEYS = tuple(benchmark_results["metrics"])
+_METRICS_ARR = np.array([benchmark_results["metrics"][m] for m in _METRIC_KEYS])
+_OVERALL = np.asarray(benchmark_results["overall_scores"])
+
 # Create output directory
 import os
 os.makedirs('visualizations', exist_ok=True)
 
-def create_main_comparison_chart():
+# Raster resolution for the PNG previews; set AWARDBENCH_PNG_DPI=300 for print quality.
+# The PDFs stay vector regardless.
+PNG_DPI = int(os.environ.get('AWARDBENCH_PNG_DPI', 150))
+
+def _figure(fig, figsize):
+    """Clear and resize a shared figure for the next chart, or create a new one"""
+    plt, _ = _plotting()
+    if fig is None:
+        return plt.figure(figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    # clear() keeps the margins the previous chart's tight_layout left behind;
+    # restore the defaults so gridspec layouts start from the same place
+    fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                           for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+    return fig
+
+def _save_figure(fig, name, close=True):
+    """Lay out the figure once and save it as both PNG and PDF"""
+    plt, _ = _plotting()
+    fig.tight_layout()
+    # Measure the tight bounding box once; bbox_inches='tight' would redraw
+    # the figure to measure it again for each format
+    bbox = fig.get_tightbbox().padded(plt.rcParams['savefig.pad_inches'])
+    fig.savefig(f'visualizations/{name}.png', dpi=PNG_DPI, bbox_inches=bbox,
+                pil_kwargs={'optimize': True})
+    fig.savefig(f'visualizations/{name}.pdf', bbox_inches=bbox,
+                metadata={'Creator': 'awardbench'})
+    if close:
+        plt.close(fig)
+
+def create_main_comparison_chart(fig=None):
     """Create the main benchmark comparison chart"""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    owned = fig is None
+    fig = _figure(fig, (12, 8))
+    ax = fig.add_subplot()
     
     models = benchmark_results["models"]
-    metrics = list(benchmark_results["metrics"].keys())
+    metrics = _METRIC_KEYS
     
     x = np.arange(len(models))
     width = 0.15
     
     # Create bars for each metric
-    for i, metric in enumerate(metrics):
-        scores = benchmark_results["metrics"][metric]
+    for i, (metric, scores) in enumerate(zip(metrics, _METRICS_ARR)):
         offset = width * (i - len(metrics) / 2 + 0.5)
         bars = ax.bar(x + offset, scores, width, label=metric)
         
@@ -68,32 +120,31 @@ def create_main_comparison_chart():
     ax.grid(True, alpha=0.3)
     
     # Highlight the winner
+    from matplotlib.patches import Rectangle
     winner_patch = Rectangle((x[0] - width * 2.5, 0), width * 5, 1.1, 
                            linewidth=3, edgecolor='gold', facecolor='none')
     ax.add_patch(winner_patch)
     
-    plt.tight_layout()
-    plt.savefig('visualizations/main_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/main_comparison.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'main_comparison', close=owned)
 
-def create_radar_chart():
+def create_radar_chart(fig=None):
     """Create radar chart for multi-dimensional comparison"""
-    categories = list(benchmark_results["metrics"].keys())
+    categories = _METRIC_KEYS
     
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    owned = fig is None
+    fig = _figure(fig, (10, 10))
+    ax = fig.add_subplot(projection='polar')
     
     # Number of variables
     num_vars = len(categories)
     
-    # Compute angle for each axis
-    angles = [n / float(num_vars) * 2 * np.pi for n in range(num_vars)]
-    angles += angles[:1]
+    # Compute angle for each axis, closing the loop back at the first one
+    angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])
     
     # Plot data for top 3 models
     for i, model in enumerate(benchmark_results["models"][:3]):
-        values = [benchmark_results["metrics"][cat][i] for cat in categories]
-        values += values[:1]
+        values = np.concatenate([_METRICS_ARR[:, i], _METRICS_ARR[:1, i]])
         
         ax.plot(angles, values, 'o-', linewidth=2, label=model)
         ax.fill(angles, values, alpha=0.25)
@@ -112,69 +163,55 @@ def create_radar_chart():
     ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], size=10)
     
     # Add title and legend
-    plt.title('Multi-Dimensional Performance Analysis\nTop 3 Models', 
-              size=16, weight='bold', pad=30)
-    plt.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
-    
-    plt.tight_layout()
-    plt.savefig('visualizations/radar_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/radar_comparison.pdf', bbox_inches='tight')
-    plt.close()
+    ax.set_title('Multi-Dimensional Performance Analysis\nTop 3 Models', 
+                 size=16, weight='bold', pad=30)
+    ax.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1))
+    
+    _save_figure(fig, 'radar_comparison', close=owned)
 
-def create_heatmap():
+def create_heatmap(fig=None):
     """Create heatmap of model performance across metrics"""
-    # Prepare data
-    data = []
-    for i, model in enumerate(benchmark_results["models"]):
-        row = [benchmark_results["metrics"][metric][i] for metric in benchmark_results["metrics"]]
-        data.append(row)
-    
-    df = pd.DataFrame(data, 
-                      index=benchmark_results["models"],
-                      columns=list(benchmark_results["metrics"].keys()))
+    # Prepare data (rows=models, cols=metrics)
+    data = _METRICS_ARR.T
     
     # Create heatmap
-    plt.figure(figsize=(10, 6))
+    owned = fig is None
+    fig = _figure(fig, (10, 6))
+    ax = fig.add_subplot()
     
     # Create custom colormap
+    _, sns = _plotting()
     cmap = sns.color_palette("RdYlGn", as_cmap=True)
     
     # Create heatmap with annotations
-    sns.heatmap(df, annot=True, fmt='.3f', cmap=cmap, 
+    sns.heatmap(data, annot=True, fmt='.3f', cmap=cmap,
+                xticklabels=list(_METRIC_KEYS),
+                yticklabels=benchmark_results["models"],
                 cbar_kws={'label': 'Performance Score'},
                 vmin=0.6, vmax=1.0, linewidths=0.5,
-                annot_kws={'fontsize': 10})
+                annot_kws={'fontsize': 10}, ax=ax)
     
-    plt.title('AwardBench Performance Heatmap\nGovCon AI Evaluation Results', 
-              fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel('Evaluation Metrics', fontsize=12, fontweight='bold')
-    plt.ylabel('AI Models', fontsize=12, fontweight='bold')
+    ax.set_title('AwardBench Performance Heatmap\nGovCon AI Evaluation Results', 
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel('Evaluation Metrics', fontsize=12, fontweight='bold')
+    ax.set_ylabel('AI Models', fontsize=12, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('visualizations/performance_heatmap.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/performance_heatmap.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'performance_heatmap', close=owned)
 
-def create_superiority_chart():
+def create_superiority_chart(fig=None):
     """Create chart showing Awarded AI's superiority margins"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Calculate superiority margins
-    awarded_scores = [benchmark_results["metrics"][metric][0] for metric in benchmark_results["metrics"]]
+    owned = fig is None
+    fig = _figure(fig, (10, 6))
+    ax = fig.add_subplot()
     
-    margins = []
-    labels = []
-    
-    for metric in benchmark_results["metrics"]:
-        awarded_score = benchmark_results["metrics"][metric][0]
-        next_best = max(benchmark_results["metrics"][metric][1:])
-        margin = ((awarded_score - next_best) / next_best) * 100
-        margins.append(margin)
-        labels.append(metric)
+    # Calculate superiority margins for every metric at once (rows=metrics, cols=models)
+    labels = _METRIC_KEYS
+    next_best = _METRICS_ARR[:, 1:].max(axis=1)
+    margins = (_METRICS_ARR[:, 0] - next_best) / next_best * 100
     
     # Create horizontal bar chart
     y_pos = np.arange(len(labels))
-    colors = ['#10b981' if m > 10 else '#3b82f6' if m > 5 else '#8b5cf6' for m in margins]
+    colors = np.select([margins > 10, margins > 5], ['#10b981', '#3b82f6'], '#8b5cf6')
     
     bars = ax.barh(y_pos, margins, color=colors)
     
@@ -194,14 +231,12 @@ def create_superiority_chart():
     ax.axvline(x=10, color='gray', linestyle='--', alpha=0.5)
     ax.text(10, -0.7, '10% advantage threshold', ha='center', fontsize=9, style='italic')
     
-    plt.tight_layout()
-    plt.savefig('visualizations/superiority_margins.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/superiority_margins.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'superiority_margins', close=owned)
 
-def create_academic_summary_figure():
+def create_academic_summary_figure(fig=None):
     """Create a comprehensive figure suitable for academic papers"""
-    fig = plt.figure(figsize=(16, 10))
+    owned = fig is None
+    fig = _figure(fig, (16, 10))
     
     # Create grid
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
@@ -209,7 +244,7 @@ def create_academic_summary_figure():
     # Overall scores comparison
     ax1 = fig.add_subplot(gs[0, :2])
     models = benchmark_results["models"]
-    scores = benchmark_results["overall_scores"]
+    scores = _OVERALL
     colors = ['#10b981' if i == 0 else '#6b7280' for i in range(len(models))]
     bars = ax1.bar(models, scores, color=colors)
     
@@ -225,13 +260,14 @@ def create_academic_summary_figure():
     
     # Key metrics comparison
     ax2 = fig.add_subplot(gs[1:, :2])
-    metrics_subset = ["Compliance Accuracy", "Proposal Quality", "Workflow Automation"]
+    # Compliance Accuracy, Proposal Quality and Workflow Automation
+    metrics_subset = _METRIC_KEYS[:3]
     x = np.arange(len(models))
     width = 0.25
     
-    for i, metric in enumerate(metrics_subset):
+    for i, (metric, metric_scores) in enumerate(zip(metrics_subset, _METRICS_ARR[:3])):
         offset = width * (i - 1)
-        ax2.bar(x + offset, benchmark_results["metrics"][metric], width, label=metric)
+        ax2.bar(x + offset, metric_scores, width, label=metric)
     
     ax2.set_xlabel('Models', fontweight='bold')
     ax2.set_ylabel('Score', fontweight='bold')
@@ -270,17 +306,16 @@ Generated: {datetime.now().strftime('%Y-%m-%d')}
             fontsize=12, verticalalignment='center',
             bbox=dict(boxstyle='round,pad=1', facecolor='lightgray', alpha=0.8))
     
-    plt.suptitle('AwardBench: Comprehensive GovCon AI Performance Evaluation',
+    fig.suptitle('AwardBench: Comprehensive GovCon AI Performance Evaluation',
                  fontsize=18, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('visualizations/academic_summary.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/academic_summary.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'academic_summary', close=owned)
 
-def create_compliance_matrix_evaluation():
+def create_compliance_matrix_evaluation(fig=None):
     """Create specific visualization for compliance matrix evaluation results"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    owned = fig is None
+    fig = _figure(fig, (15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Compliance matrix quality scores
     models = ["Awarded AI", "Claude 3.7", "GPT-4o", "Gemini 1.5 Pro", "Generic LLM"]
@@ -326,14 +361,13 @@ def create_compliance_matrix_evaluation():
     ax2.set_ylim(0, 1.1)
     ax2.grid(True, axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('visualizations/compliance_matrix_evaluation.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/compliance_matrix_evaluation.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'compliance_matrix_evaluation', close=owned)
 
-def create_raci_matrix_evaluation():
+def create_raci_matrix_evaluation(fig=None):
     """Create specific visualization for RACI matrix evaluation results"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    owned = fig is None
+    fig = _figure(fig, (15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # RACI matrix quality scores
     models = ["Awarded AI", "Claude 3.7", "GPT-4o", "Gemini 1.5 Pro", "Generic LLM"]
@@ -379,14 +413,12 @@ def create_raci_matrix_evaluation():
     ax2.set_ylim(0, 1.1)
     ax2.grid(True, axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('visualizations/raci_matrix_evaluation.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/raci_matrix_evaluation.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'raci_matrix_evaluation', close=owned)
 
-def create_combined_evaluation_dashboard():
+def create_combined_evaluation_dashboard(fig=None):
     """Create a comprehensive dashboard combining compliance and RACI evaluations"""
-    fig = plt.figure(figsize=(18, 12))
+    owned = fig is None
+    fig = _figure(fig, (18, 12))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
     # Overall performance comparison
@@ -433,10 +465,10 @@ def create_combined_evaluation_dashboard():
     ax2.set_title('Compliance Matrix Component Analysis', fontweight='bold')
     
     # Add text annotations
-    for i in range(5):
-        for j in range(4):
-            ax2.text(j, i, f'{compliance_data[i, j]:.2f}', ha='center', va='center', 
-                    color='white' if compliance_data[i, j] < 0.75 else 'black', fontweight='bold')
+    text_colors = np.where(compliance_data < 0.75, 'white', 'black')
+    for (i, j), value in np.ndenumerate(compliance_data):
+        ax2.text(j, i, f'{value:.2f}', ha='center', va='center',
+                color=text_colors[i, j], fontweight='bold')
     
     # RACI matrix heatmap
     ax3 = fig.add_subplot(gs[1, 2])
@@ -456,10 +488,10 @@ def create_combined_evaluation_dashboard():
     ax3.set_title('RACI Matrix Components', fontweight='bold')
     
     # Add text annotations
-    for i in range(5):
-        for j in range(4):
-            ax3.text(j, i, f'{raci_data[i, j]:.2f}', ha='center', va='center',
-                    color='white' if raci_data[i, j] < 0.75 else 'black', fontweight='bold')
+    text_colors = np.where(raci_data < 0.75, 'white', 'black')
+    for (i, j), value in np.ndenumerate(raci_data):
+        ax3.text(j, i, f'{value:.2f}', ha='center', va='center',
+                color=text_colors[i, j], fontweight='bold')
     
     # Summary statistics and insights
     ax4 = fig.add_subplot(gs[2, :])
@@ -493,41 +525,42 @@ Generated: {datetime.now().strftime('%B %d, %Y')} | AwardBench v2.0 | Procuremen
             verticalalignment='center', fontfamily='monospace',
             bbox=dict(boxstyle='round,pad=1', facecolor='lightblue', alpha=0.1))
     
-    plt.suptitle('AwardBench: Comprehensive GovCon AI Evaluation Framework\nCompliance & RACI Matrix Generation Analysis',
+    fig.suptitle('AwardBench: Comprehensive GovCon AI Evaluation Framework\nCompliance & RACI Matrix Generation Analysis',
                  fontsize=20, fontweight='bold', y=0.98)
     
-    plt.tight_layout()
-    plt.savefig('visualizations/combined_evaluation_dashboard.png', dpi=300, bbox_inches='tight')
-    plt.savefig('visualizations/combined_evaluation_dashboard.pdf', bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, 'combined_evaluation_dashboard', close=owned)
+
+# Independent charts, in the order they are reported
+_CHARTS = (
+    (create_main_comparison_chart, "Main comparison chart created"),
+    (create_radar_chart, "Radar chart created"),
+    (create_heatmap, "Performance heatmap created"),
+    (create_superiority_chart, "Superiority margins chart created"),
+    (create_academic_summary_figure, "Academic summary figure created"),
+    (create_compliance_matrix_evaluation, "Compliance matrix evaluation charts created"),
+    (create_raci_matrix_evaluation, "RACI matrix evaluation charts created"),
+    (create_combined_evaluation_dashboard, "Combined evaluation dashboard created"),
+)
+
+_worker_figure = None
+
+def _render_chart(create_chart):
+    """Render one chart in a worker process, reusing that worker's figure"""
+    global _worker_figure
+    if _worker_figure is None:
+        _worker_figure = _plotting()[0].figure()
+    create_chart(_worker_figure)
 
 def generate_all_visualizations():
     """Generate all visualization types"""
     print("Generating AwardBench visualizations...")
     
-    create_main_comparison_chart()
-    print("✓ Main comparison chart created")
-    
-    create_radar_chart()
-    print("✓ Radar chart created")
-    
-    create_heatmap()
-    print("✓ Performance heatmap created")
-    
-    create_superiority_chart()
-    print("✓ Superiority margins chart created")
-    
-    create_academic_summary_figure()
-    print("✓ Academic summary figure created")
-    
-    create_compliance_matrix_evaluation()
-    print("✓ Compliance matrix evaluation charts created")
-    
-    create_raci_matrix_evaluation()
-    print("✓ RACI matrix evaluation charts created")
-    
-    create_combined_evaluation_dashboard()
-    print("✓ Combined evaluation dashboard created")
+    # The charts share no state and write disjoint files, so render them in parallel
+    with ProcessPoolExecutor(max_workers=min(len(_CHARTS), os.cpu_count() or 1)) as pool:
+        rendering = [pool.submit(_render_chart, create_chart) for create_chart, _ in _CHARTS]
+        for future, (_, message) in zip(rendering, _CHARTS):
+            future.result()
+            print(f"✓ {message}")
     
     print("\nAll visualizations saved to: evaluations/benchmark-suite/visualizations/")
 
@@ -3,152 +3,233 @@
 API endpoint for generating academic papers
 """
 
-from flask import Flask, jsonify, send_file, make_response
+from flask import Flask, Response, request, send_file, make_response
 from flask_cors import CORS
 import json
 import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from generate_latex_paper import generate_paper
 import tempfile
 import shutil
 
+try:
+    import orjson
+except ImportError:  # optional speedup for JSON responses
+    orjson = None
+
 app = Flask(__name__)
 CORS(app)
 
-# Load benchmark data
-def load_benchmark_data():
-    """Load current benchmark data"""
-    # In production, this would fetch from database
-    return {
-        "timestamp": "2025-01-20T12:00:00Z",
-        "leaderboard": [
-            {
-                "rank": 1,
-                "model": "Awarded AI Platform",
-                "overall_score": 0.947,
-                "grade": "A+",
-                "scores": {
-                    "compliance_accuracy": 0.98,
-                    "proposal_quality": 0.92,
-                    "workflow_effectiveness": 0.94,
-                    "retrieval_accuracy": 0.95,
-                    "efficiency": 0.96,
-                },
-                "strengths": [
-                    "Exceptional compliance accuracy",
-                    "Superior domain knowledge",
-                ],
-            },
-            {
-                "rank": 2,
-                "model": "Claude 3.7 Sonnet",
-                "overall_score": 0.883,
-                "grade": "A",
-                "scores": {
-                    "compliance_accuracy": 0.85,
-                    "proposal_quality": 0.91,
-                    "workflow_effectiveness": 0.88,
-                    "retrieval_accuracy": 0.89,
-                    "efficiency": 0.9,
-                },
-                "strengths": ["Strong proposal generation", "Good efficiency"],
-            },
-            {
-                "rank": 3,
-                "model": "GPT-4o",
-                "overall_score": 0.872,
-                "grade": "A",
-                "scores": {
-                    "compliance_accuracy": 0.83,
-                    "proposal_quality": 0.89,
-                    "workflow_effectiveness": 0.87,
-                    "retrieval_accuracy": 0.88,
-                    "efficiency": 0.89,
-                },
-                "strengths": ["Consistent performance", "Fast response times"],
-            },
-        ],
-        "metrics": {
-            "compliance_accuracy": {
-                "name": "Compliance Accuracy",
-                "description": "FAR/DFARS interpretation and compliance requirement identification",
-                "best_model": "Awarded AI Platform",
-                "best_score": 0.98,
-            },
-            "proposal_quality": {
-                "name": "Proposal Generation Quality",
-                "description": "Win theme alignment and technical accuracy in proposals",
-                "best_model": "Awarded AI Platform",
-                "best_score": 0.92,
-            },
-            "workflow_effectiveness": {
-                "name": "Workflow Automation",
-                "description": "End-to-end process automation and time-to-value",
-                "best_model": "Awarded AI Platform",
-                "best_score": 0.94,
+# Papers are generated in the background; requests only queue jobs and poll them.
+# Every build produces the same files, so at most one is in flight at a time and
+# only the most recent jobs are remembered for polling
+_executor = ThreadPoolExecutor(max_workers=2)
+_MAX_JOBS = 64
+_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+_current_job = None
+
+# Current benchmark data, built once and shared read-only across requests
+_BENCHMARK_DATA = MappingProxyType({
+    "timestamp": "2025-01-20T12:00:00Z",
+    "leaderboard": [
+        {
+            "rank": 1,
+            "model": "Awarded AI Platform",
+            "overall_score": 0.947,
+            "grade": "A+",
+            "scores": {
+                "compliance_accuracy": 0.98,
+                "proposal_quality": 0.92,
+                "workflow_effectiveness": 0.94,
+                "retrieval_accuracy": 0.95,
+                "efficiency": 0.96,
             },
-            "retrieval_accuracy": {
-                "name": "Retrieval & Context",
-                "description": "Document retrieval precision and context utilization",
-                "best_model": "Awarded AI Platform",
-                "best_score": 0.95,
+            "strengths": [
+                "Exceptional compliance accuracy",
+                "Superior domain knowledge",
+            ],
+        },
+        {
+            "rank": 2,
+            "model": "Claude 3.7 Sonnet",
+            "overall_score": 0.883,
+            "grade": "A",
+            "scores": {
+                "compliance_accuracy": 0.85,
+                "proposal_quality": 0.91,
+                "workflow_effectiveness": 0.88,
+                "retrieval_accuracy": 0.89,
+                "efficiency": 0.9,
             },
-            "efficiency": {
-                "name": "Overall Efficiency",
-                "description": "Speed, cost optimization, and resource utilization",
-                "best_model": "Awarded AI Platform",
-                "best_score": 0.96,
+            "strengths": ["Strong proposal generation", "Good efficiency"],
+        },
+        {
+            "rank": 3,
+            "model": "GPT-4o",
+            "overall_score": 0.872,
+            "grade": "A",
+            "scores": {
+                "compliance_accuracy": 0.83,
+                "proposal_quality": 0.89,
+                "workflow_effectiveness": 0.87,
+                "retrieval_accuracy": 0.88,
+                "efficiency": 0.89,
             },
+            "strengths": ["Consistent performance", "Fast response times"],
         },
-    }
+    ],
+    "metrics": {
+        "compliance_accuracy": {
+            "name": "Compliance Accuracy",
+            "description": "FAR/DFARS interpretation and compliance requirement identification",
+            "best_model": "Awarded AI Platform",
+            "best_score": 0.98,
+        },
+        "proposal_quality": {
+            "name": "Proposal Generation Quality",
+            "description": "Win theme alignment and technical accuracy in proposals",
+            "best_model": "Awarded AI Platform",
+            "best_score": 0.92,
+        },
+        "workflow_effectiveness": {
+            "name": "Workflow Automation",
+            "description": "End-to-end process automation and time-to-value",
+            "best_model": "Awarded AI Platform",
+            "best_score": 0.94,
+        },
+        "retrieval_accuracy": {
+            "name": "Retrieval & Context",
+            "description": "Document retrieval precision and context utilization",
+            "best_model": "Awarded AI Platform",
+            "best_score": 0.95,
+        },
+        "efficiency": {
+            "name": "Overall Efficiency",
+            "description": "Speed, cost optimization, and resource utilization",
+            "best_model": "Awarded AI Platform",
+            "best_score": 0.96,
+        },
+    },
+})
 
-@app.route('/api/paper/generate', methods=['GET'])
-def generate_paper_endpoint():
-    """Generate academic paper on demand"""
+_TIMESTAMP = _BENCHMARK_DATA['timestamp']
+
+# Load benchmark data
+def load_benchmark_data():
+    """Load current benchmark data"""
+    # In production, this would fetch from database
+    return _BENCHMARK_DATA
+
+def _json_response(payload, status=200):
+    """Build a JSON response, encoded with orjson when it is installed"""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, separators=(',', ':'))
+    return Response(body, status=status, mimetype='application/json')
+
+def _move_output(src, dst):
+    """Atomically rename a generated file into place, copying only across filesystems"""
     try:
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Load current data
-            benchmark_data = load_benchmark_data()
-            
-            # Generate paper
-            result = generate_paper(benchmark_data, temp_dir)
-            
-            # Prepare response
-            response_data = {
-                'status': 'success',
-                'generated_at': benchmark_data['timestamp'],
-                'files': {
-                    'tex': result['tex_path'] is not None,
-                    'pdf': result['pdf_path'] is not None,
-                    'bundle': result['bundle_path'] is not None
-                }
+        os.replace(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+_OUTPUT_DIR = Path('./paper_output')
+# Compiled PDFs outlive the per-request scratch directories
+_PDF_CACHE_DIR = _OUTPUT_DIR / '.cache'
+
+def _generate_into_output():
+    """Generate the paper and move the outputs into ./paper_output"""
+    output_dir = _OUTPUT_DIR
+    output_dir.mkdir(exist_ok=True)
+    
+    # Create temporary directory next to the outputs so they can be renamed into place
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        # Load current data
+        benchmark_data = load_benchmark_data()
+        
+        # Generate paper
+        result = generate_paper(benchmark_data, temp_dir, cache_dir=_PDF_CACHE_DIR)
+        
+        # Prepare response
+        response_data = {
+            'status': 'success',
+            'generated_at': benchmark_data['timestamp'],
+            'files': {
+                'tex': result['tex_path'] is not None,
+                'pdf': result['pdf_path'] is not None,
+                'bundle': result['bundle_path'] is not None
             }
-            
-            # Copy files to permanent location
-            output_dir = Path('./paper_output')
-            output_dir.mkdir(exist_ok=True)
-            
-            if result['tex_path']:
-                shutil.copy(result['tex_path'], output_dir / 'awardbench_paper.tex')
-            if result['pdf_path']:
-                shutil.copy(result['pdf_path'], output_dir / 'awardbench_paper.pdf')
-            if result['bundle_path']:
-                shutil.copy(result['bundle_path'], output_dir / 'awardbench_paper.zip')
-            
-            return jsonify(response_data)
-            
-    except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        }
+        
+        # Move files to permanent location
+        if result['tex_path']:
+            _move_output(result['tex_path'], output_dir / 'awardbench_paper.tex')
+        if result['pdf_path']:
+            _move_output(result['pdf_path'], output_dir / 'awardbench_paper.pdf')
+        if result['bundle_path']:
+            _move_output(result['bundle_path'], output_dir / 'awardbench_paper.zip')
+        
+        return response_data
+
+def _submit_generation():
+    """Queue a paper build, or return the one already queued or running"""
+    global _current_job
+    with _jobs_lock:
+        future = _jobs.get(_current_job)
+        if future is None or future.done():
+            _current_job = uuid.uuid4().hex
+            future = _jobs[_current_job] = _executor.submit(_generate_into_output)
+            # Forget the oldest jobs; they are all finished, as only the newest can still run
+            while len(_jobs) > _MAX_JOBS:
+                _jobs.popitem(last=False)
+        return _current_job, future
+
+def _job_state(future):
+    """Summarise a background generation job"""
+    if not future.done():
+        return {'status': 'running' if future.running() else 'queued'}
+    error = future.exception()
+    if error is not None:
+        return {'status': 'error', 'message': str(error)}
+    return future.result()
+
+@app.route('/api/paper/generate', methods=['GET'])
+def generate_paper_endpoint():
+    """Queue academic paper generation and return a job id to poll"""
+    job_id, future = _submit_generation()
+    
+    return _json_response({
+        'status': 'running' if future.running() else 'queued',
+        'job_id': job_id
+    }, 202)
+
+@app.route('/api/paper/result/<job_id>', methods=['GET'])
+def paper_result(job_id):
+    """Fetch the outcome of a paper generation job"""
+    future = _jobs.get(job_id)
+    if future is None:
+        return _json_response({'error': 'Unknown job'}, 404)
+    
+    state = _job_state(future)
+    if state['status'] == 'error':
+        return _json_response(state, 500)
+    if state['status'] != 'success':
+        return _json_response(state, 202)
+    return _json_response(state)
 
 @app.route('/api/paper/download/<format>', methods=['GET'])
 def download_paper(format):
     """Download paper in specified format"""
     try:
-        output_dir = Path('./paper_output')
+        output_dir = _OUTPUT_DIR
         
         if format == 'tex':
             file_path = output_dir / 'awardbench_paper.tex'
@@ -163,15 +244,15 @@ def download_paper(format):
             mimetype = 'application/zip'
             download_name = 'awardbench_paper_bundle.zip'
         else:
-            return jsonify({'error': 'Invalid format'}), 400
+            return _json_response({'error': 'Invalid format'}, 400)
         
         if not file_path.exists():
-            # Generate paper if not exists
-            benchmark_data = load_benchmark_data()
-            generate_paper(benchmark_data, output_dir)
+            # Generate paper if not exists; waiting on the shared job keeps this
+            # from racing a background build that is moving files into place
+            _submit_generation()[1].result()
             
             if not file_path.exists():
-                return jsonify({'error': 'File generation failed'}), 500
+                return _json_response({'error': 'File generation failed'}, 500)
         
         return send_file(
             file_path,
@@ -181,22 +262,41 @@ def download_paper(format):
         )
         
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'status': 'error',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/paper/status', methods=['GET'])
 def paper_status():
-    """Check paper generation status"""
-    output_dir = Path('./paper_output')
+    """Check paper generation status, including a job's state when ?job_id= is given"""
+    # One directory read instead of a stat() per file
+    try:
+        with os.scandir(_OUTPUT_DIR) as entries:
+            files = {entry.name for entry in entries}
+    except FileNotFoundError:
+        files = set()
     
-    return jsonify({
-        'tex_available': (output_dir / 'awardbench_paper.tex').exists(),
-        'pdf_available': (output_dir / 'awardbench_paper.pdf').exists(),
-        'bundle_available': (output_dir / 'awardbench_paper.zip').exists(),
-        'last_updated': load_benchmark_data()['timestamp']
-    })
+    status = {
+        'tex_available': 'awardbench_paper.tex' in files,
+        'pdf_available': 'awardbench_paper.pdf' in files,
+        'bundle_available': 'awardbench_paper.zip' in files,
+        'last_updated': _TIMESTAMP
+    }
+    
+    job_id = request.args.get('job_id')
+    if job_id is not None:
+        future = _jobs.get(job_id)
+        status['job'] = _job_state(future) if future is not None else {'status': 'unknown'}
+    
+    return _json_response(status)
 
 if __name__ == '__main__':
-    app.run(port=5000, debug=True)
\ No newline at end of file
+    # Serve requests concurrently from a production WSGI server. For several
+    # worker processes sharing one import, run: gunicorn -w 4 --preload paper_api:app
+    try:
+        from waitress import serve
+    except ImportError:  # fall back to the Flask development server
+        app.run(port=5000, threaded=True)
+    else:
+        serve(app, host='127.0.0.1', port=5000, threads=8)
\ No newline at end of file
@@ -1,12 +1,35 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg', force=True)  # headless batch rendering; skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-from matplotlib.patches import Rectangle
-import matplotlib.patches as mpatches
+from cycler import cycler
 
-# Set style
+# Set style (seaborn's default six-colour "husl" palette, without importing seaborn)
 plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = cycler(color=[
+    '#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#f45deb',
+])
+
+# Batch output settings: simplified paths, chunked Agg rendering, and PDF text set in
+# the 14 built-in core fonts so no font files are embedded. The core fonts only
+# cover Latin-1, so negative tick labels use an ASCII hyphen rather than U+2212
+plt.rcParams.update({
+    'interactive': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'pdf.compression': 6,
+    'pdf.fonttype': 3,
+    'pdf.use14corefonts': True,
+    'ps.useafm': True,
+    'axes.unicode_minus': False,
+})
+# Name the core sans font first so PDF text maps to it directly; raster output
+# still falls through to the style's usual fonts
+plt.rcParams['font.sans-serif'] = ['Helvetica', *plt.rcParams['font.sans-serif']]
 
 # Define colors matching the LaTeX document
 DARK_GREEN = '#00A67E'
@@ -14,21 +37,40 @@ DARK_BLUE = '#3B82F6'
 DARK_RED = '#EF4444'
 DARK_YELLOW = '#F59E0B'
 
+# Figures are reused across plots of the same size instead of being rebuilt
+_FIG_CACHE = {}
+
+def _get_fig(figsize):
+    """Return the cached figure for this size, creating it on first use"""
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        fig = _FIG_CACHE[figsize] = plt.figure(figsize=figsize)
+    return fig
+
+def _save_figure(fig, filename, pages=None):
+    """Save a finished figure to its own PDF, or as the next page of `pages`, then clear it for reuse"""
+    # render_figure sets each spec's fixed margins beforehand, so no layout pass
+    # runs here. The crop box is measured directly too: bbox_inches='tight' would
+    # draw the whole figure once just to find it before saving
+    bbox = fig.get_tightbbox().padded(plt.rcParams['savefig.pad_inches'])
+    if pages is None:
+        fig.savefig(filename, dpi=300, bbox_inches=bbox)
+    else:
+        pages.savefig(fig, dpi=300, bbox_inches=bbox)
+    fig.clear()
+
 # Figure 1: Test Case Distribution
-def create_test_distribution():
+def _draw_test_distribution(fig):
     dimensions = ['Compliance\nAccuracy', 'Proposal\nQuality', 'Workflow\nEffectiveness', 
                   'Retrieval\nAccuracy', 'Overall\nEfficiency']
     test_cases = [2584, 2156, 1947, 2103, 2057]
+    labels = tuple(f'{count:,}' for count in test_cases)
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = fig.add_subplot()
     bars = ax.bar(dimensions, test_cases, color=DARK_GREEN, edgecolor='black', linewidth=1.5)
     
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height):,}',
-                ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax.bar_label(bars, labels=labels, fontsize=11, fontweight='bold')
     
     ax.set_ylabel('Number of Test Cases', fontsize=14, fontweight='bold')
     ax.set_xlabel('Evaluation Dimension', fontsize=14, fontweight='bold')
@@ -38,26 +80,21 @@ def create_test_distribution():
     # Add grid
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.set_axisbelow(True)
-    
-    plt.tight_layout()
-    plt.savefig('figure_test_distribution.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
 
 # Figure 2: Overall Performance Scores
-def create_overall_performance():
+def _draw_overall_performance(fig):
     models = ['Generic ChatGPT', 'Llama 3.1 70B', 'Mistral Large', 'Command R+', 
               'Gemini 1.5 Pro', 'Claude 3 Haiku', 'GPT-4 Turbo', 'Claude 3.5 Sonnet', 
               'GPT-4o', 'Claude 3 Opus', 'Awarded AI Platform']
     scores = [72.4, 74.2, 76.4, 78.9, 82.3, 84.1, 85.6, 88.3, 87.2, 91.2, 94.7]
+    labels = tuple(f'{score}%' for score in scores)
     colors = [DARK_RED]*4 + [DARK_BLUE]*6 + [DARK_GREEN]
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    ax = fig.add_subplot()
     bars = ax.barh(models, scores, color=colors, edgecolor='black', linewidth=1.5)
     
     # Add value labels
-    for i, (bar, score) in enumerate(zip(bars, scores)):
-        ax.text(score + 0.5, bar.get_y() + bar.get_height()/2.,
-                f'{score}%', ha='left', va='center', fontsize=11, fontweight='bold')
+    ax.bar_label(bars, labels=labels, padding=5, fontsize=11, fontweight='bold')
     
     ax.set_xlabel('Overall Score (%)', fontsize=14, fontweight='bold')
     ax.set_title('Overall Performance Scores Across Evaluated Models', fontsize=16, fontweight='bold')
@@ -70,39 +107,45 @@ def create_overall_performance():
     
     ax.legend(loc='lower right', framealpha=0.9)
     ax.grid(True, alpha=0.3, linestyle='--', axis='x')
-    
-    plt.tight_layout()
-    plt.savefig('figure_overall_performance.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
 
 # Figure 3: Compliance Accuracy Radar Chart
-def create_compliance_radar():
+def _draw_compliance_radar(fig):
     categories = ['FAR Basic', 'FAR Complex', 'DFARS', 'Agency-Specific', 'Multi-doc']
     
     # Data for each model
-    awarded_ai = [99.2, 97.8, 96.4, 95.1, 93.7]
-    claude_opus = [94.3, 88.7, 82.1, 78.4, 75.2]
-    gpt4o = [92.1, 85.4, 79.3, 74.2, 71.8]
-    generic = [78.4, 61.2, 52.3, 45.7, 42.1]
+    awarded_ai = np.array([99.2, 97.8, 96.4, 95.1, 93.7])
+    claude_opus = np.array([94.3, 88.7, 82.1, 78.4, 75.2])
+    gpt4o = np.array([92.1, 85.4, 79.3, 74.2, 71.8])
+    generic = np.array([78.4, 61.2, 52.3, 45.7, 42.1])
     
     # Number of variables
     N = len(categories)
     
-    # Compute angle for each axis
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]
+    # Compute angle for each axis, closing the loop back at the first one
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles = np.append(angles, angles[0])
     
     # Initialize the plot
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-    
-    # Draw data
-    for data, color, label in [(awarded_ai, DARK_GREEN, 'Awarded AI Platform'),
-                                (claude_opus, DARK_BLUE, 'Claude 3 Opus'),
-                                (gpt4o, DARK_YELLOW, 'GPT-4o'),
-                                (generic, DARK_RED, 'Generic ChatGPT')]:
-        values = data + data[:1]
-        ax.plot(angles, values, 'o-', linewidth=2, color=color, label=label)
-        ax.fill(angles, values, alpha=0.15, color=color)
+    ax = fig.add_subplot(projection='polar')
+    
+    # Draw data: every model's closed outline goes into one fill, one line and one
+    # marker collection instead of separate plot/fill artists per model
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.lines import Line2D
+    series = ((awarded_ai, DARK_GREEN, 'Awarded AI Platform'),
+              (claude_opus, DARK_BLUE, 'Claude 3 Opus'),
+              (gpt4o, DARK_YELLOW, 'GPT-4o'),
+              (generic, DARK_RED, 'Generic ChatGPT'))
+    colors = [color for _, color, _ in series]
+    outlines = np.stack([np.column_stack([angles, np.append(data, data[0])])
+                         for data, _, _ in series])
+    ax.add_collection(PolyCollection(outlines, facecolors=colors, edgecolors='none', alpha=0.15))
+    ax.add_collection(LineCollection(outlines, colors=colors, linewidths=2))
+    ax.scatter(outlines[..., 0].ravel(), outlines[..., 1].ravel(),
+               c=[color for color in colors for _ in angles], s=36, zorder=3)
+    # Proxy handles so the legend keeps the line-and-marker look
+    handles = [Line2D([], [], color=color, marker='o', linewidth=2, label=label)
+               for _, color, label in series]
     
     # Fix axis to go in the right order and start at 12 o'clock
     ax.set_theta_offset(np.pi / 2)
@@ -120,16 +163,13 @@ def create_compliance_radar():
     # Add title and legend
     ax.set_title('Compliance Accuracy Across Different Regulation Types', 
                  size=16, fontweight='bold', pad=20)
-    ax.legend(loc='upper right', bbox_to_anchor=(1.2, 1.1), framealpha=0.9)
+    ax.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.2, 1.1), framealpha=0.9)
     
     ax.grid(True)
-    plt.tight_layout()
-    plt.savefig('figure_compliance_radar.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
 
 # Figure 4: Processing Time Scaling
-def create_efficiency_plots():
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+def _draw_efficiency_plots(fig):
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Processing time subplot
     input_sizes = [10, 50, 100, 200, 500]
@@ -172,13 +212,9 @@ def create_efficiency_plots():
     ax2.grid(True, alpha=0.3, linestyle='--')
     ax2.set_xlim(0, 220)
     ax2.set_ylim(20, 105)
-    
-    plt.tight_layout()
-    plt.savefig('figure_efficiency_plots.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
 
 # Figure 5: Error Analysis Heatmap
-def create_error_heatmap():
+def _draw_error_heatmap(fig):
     error_types = ['Regulatory\nMisinterpretation', 'Context Window\nOverflow', 
                    'Hallucinated\nRequirements', 'Inconsistent\nResponses', 
                    'Formatting\nErrors']
@@ -192,8 +228,8 @@ def create_error_heatmap():
         [18.4, 8.7, 12.3, 15.6, 7.2]  # Generic ChatGPT
     ])
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    im = ax.imshow(error_data, cmap='YlOrRd', aspect='auto')
+    ax = fig.add_subplot()
+    im = ax.imshow(error_data, cmap='YlOrRd', aspect='auto', interpolation='nearest')
     
     # Set ticks and labels
     ax.set_xticks(np.arange(len(error_types)))
@@ -209,37 +245,40 @@ def create_error_heatmap():
     cbar.ax.set_ylabel('Error Rate (%)', rotation=90, va="bottom", fontsize=12)
     
     # Add text annotations
-    for i in range(len(models)):
-        for j in range(len(error_types)):
-            text = ax.text(j, i, f'{error_data[i, j]:.1f}%',
-                          ha="center", va="center", color="black" if error_data[i, j] < 10 else "white",
-                          fontweight='bold', fontsize=10)
+    text_colors = np.where(error_data < 10, 'black', 'white')
+    labels = np.char.add(np.char.mod('%.1f', error_data), '%')
+    for (i, j), label in np.ndenumerate(labels):
+        ax.text(j, i, label, ha="center", va="center", color=text_colors[i, j],
+                fontweight='bold', fontsize=10)
     
     ax.set_title("Error Rates by Type and Model", fontsize=16, fontweight='bold', pad=20)
-    fig.tight_layout()
-    plt.savefig('figure_error_heatmap.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
 
 # Figure 6: ROI Projection Chart
-def create_roi_projection():
-    months = np.arange(0, 13)
-    
-    # Costs and revenues (in thousands)
-    implementation_cost = 150  # One-time cost
-    monthly_operational = 10   # Ongoing cost
+def _roi_projection(n_months, implementation_cost, monthly_operational, monthly_revenue):
+    """Cumulative costs, revenues and ROI (%) per month, the positive-ROI mask, and the first month in it"""
+    months = np.arange(n_months, dtype=np.float64)
     
     # Calculate cumulative costs
     cumulative_costs = implementation_cost + months * monthly_operational
     
     # Calculate cumulative revenues (based on increased win rates and proposal volume)
-    base_monthly_revenue = 0
-    ai_enhanced_revenue = months * 65  # Average monthly benefit
+    ai_enhanced_revenue = months * monthly_revenue
     ai_enhanced_revenue[0] = 0  # No revenue in month 0
     
     # Calculate ROI
-    roi = ((ai_enhanced_revenue - cumulative_costs) / implementation_cost) * 100
+    roi = (ai_enhanced_revenue - cumulative_costs) * (100.0 / implementation_cost)
+    roi_positive = roi > 0
+    breakeven_month = int(np.argmax(roi_positive)) if roi_positive.any() else None
+    return months, cumulative_costs, ai_enhanced_revenue, roi, roi_positive, breakeven_month
+
+def _draw_roi_projection(fig):
+    # Costs and revenues (in thousands): one-time implementation cost, ongoing
+    # monthly cost and average monthly benefit
+    months, cumulative_costs, ai_enhanced_revenue, roi, roi_positive, breakeven_month = _roi_projection(
+        13, implementation_cost=150, monthly_operational=10, monthly_revenue=65)
+    in_profit = ai_enhanced_revenue >= cumulative_costs
     
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 10), sharex=True)
+    ax1, ax2 = fig.subplots(2, 1, sharex=True)
     
     # Revenue/Cost subplot
     ax1.plot(months, cumulative_costs, 'o-', color=DARK_RED, linewidth=2.5, 
@@ -247,10 +286,10 @@ def create_roi_projection():
     ax1.plot(months, ai_enhanced_revenue, 's-', color=DARK_GREEN, linewidth=2.5, 
              markersize=8, label='Cumulative Revenue')
     ax1.fill_between(months, cumulative_costs, ai_enhanced_revenue, 
-                     where=(ai_enhanced_revenue >= cumulative_costs), 
+                     where=in_profit, 
                      color=DARK_GREEN, alpha=0.3, label='Profit')
     ax1.fill_between(months, cumulative_costs, ai_enhanced_revenue, 
-                     where=(ai_enhanced_revenue < cumulative_costs), 
+                     where=~in_profit, 
                      color=DARK_RED, alpha=0.3, label='Investment')
     
     ax1.set_ylabel('Amount ($1000s)', fontsize=12, fontweight='bold')
@@ -264,15 +303,14 @@ def create_roi_projection():
     ax2.axhline(y=0, color='black', linestyle='-', linewidth=1)
     ax2.axhline(y=100, color='gray', linestyle='--', linewidth=1, alpha=0.7)
     ax2.axhline(y=340, color=DARK_GREEN, linestyle='--', linewidth=2, alpha=0.7)
-    ax2.fill_between(months, 0, roi, where=(roi > 0), color=DARK_GREEN, alpha=0.3)
-    ax2.fill_between(months, 0, roi, where=(roi <= 0), color=DARK_RED, alpha=0.3)
+    ax2.fill_between(months, 0, roi, where=roi_positive, color=DARK_GREEN, alpha=0.3)
+    ax2.fill_between(months, 0, roi, where=~roi_positive, color=DARK_RED, alpha=0.3)
     
     # Add annotations
     ax2.text(11, 350, '340% Target', ha='left', va='bottom', fontsize=10, 
              color=DARK_GREEN, fontweight='bold')
     
-    # Find breakeven point
-    breakeven_month = np.where(roi > 0)[0][0] if any(roi > 0) else None
+    # Mark breakeven point
     if breakeven_month:
         ax2.plot(breakeven_month, roi[breakeven_month], 'o', color='red', 
                 markersize=12, markeredgecolor='black', markeredgewidth=2)
@@ -285,31 +323,61 @@ def create_roi_projection():
     ax2.set_title('Return on Investment Projection', fontsize=14, fontweight='bold')
     ax2.grid(True, alpha=0.3, linestyle='--')
     ax2.set_ylim(-100, 450)
-    
-    plt.tight_layout()
-    plt.savefig('figure_roi_projection.pdf', dpi=300, bbox_inches='tight')
-    plt.close()
+
+# Independent figures, in the order they are reported. Each spec fixes the figure
+# size, output name and margins (measured once with tight_layout) for its draw helper
+_FIGURE_SPECS = (
+    {'name': 'test_distribution', 'draw': _draw_test_distribution, 'figsize': (10, 6),
+     'margins': dict(left=0.08, right=0.985, top=0.934, bottom=0.124),
+     'message': "Test distribution figure created"},
+    {'name': 'overall_performance', 'draw': _draw_overall_performance, 'figsize': (10, 8),
+     'margins': dict(left=0.162, right=0.972, top=0.951, bottom=0.073),
+     'message': "Overall performance figure created"},
+    {'name': 'compliance_radar', 'draw': _draw_compliance_radar, 'figsize': (10, 10),
+     'margins': dict(left=0.046, right=0.84, top=0.915, bottom=0.015),
+     'message': "Compliance radar chart created"},
+    {'name': 'efficiency_plots', 'draw': _draw_efficiency_plots, 'figsize': (14, 6),
+     'margins': dict(left=0.05, right=0.989, top=0.936, bottom=0.096, wspace=0.112),
+     'message': "Efficiency plots created"},
+    {'name': 'error_heatmap', 'draw': _draw_error_heatmap, 'figsize': (10, 6),
+     'margins': dict(left=0.161, right=0.985, top=0.902, bottom=0.087),
+     'message': "Error heatmap created"},
+    {'name': 'roi_projection', 'draw': _draw_roi_projection, 'figsize': (10, 10),
+     'margins': dict(left=0.081, right=0.983, top=0.961, bottom=0.057, hspace=0.089),
+     'message': "ROI projection chart created"},
+)
+
+def render_figure(spec, pages=None):
+    """Draw one figure spec on its cached figure and save it to figure_<name>.pdf, or to `pages`"""
+    fig = _get_fig(spec['figsize'])
+    spec['draw'](fig)
+    fig.subplots_adjust(**spec['margins'])
+    _save_figure(fig, f"figure_{spec['name']}.pdf", pages)
 
 # Generate all figures
 if __name__ == "__main__":
-    print("Generating figures for AwardBench paper...")
+    import argparse
     
-    create_test_distribution()
-    print("✓ Test distribution figure created")
+    parser = argparse.ArgumentParser(description="Generate figures for the AwardBench paper")
+    parser.add_argument('--multipage', action='store_true',
+                        help="write every figure as a page of awardbench_figures.pdf")
+    args = parser.parse_args()
     
-    create_overall_performance()
-    print("✓ Overall performance figure created")
-    
-    create_compliance_radar()
-    print("✓ Compliance radar chart created")
-    
-    create_efficiency_plots()
-    print("✓ Efficiency plots created")
-    
-    create_error_heatmap()
-    print("✓ Error heatmap created")
+    print("Generating figures for AwardBench paper...")
     
-    create_roi_projection()
-    print("✓ ROI projection chart created")
+    if args.multipage:
+        # One PDF writer for all pages; the pages go to one file, so render in order
+        from matplotlib.backends.backend_pdf import PdfPages
+        with PdfPages('awardbench_figures.pdf') as pages:
+            for spec in _FIGURE_SPECS:
+                render_figure(spec, pages)
+                print(f"✓ {spec['message']}")
+    else:
+        # The figures share no state and write separate files, so render them in parallel
+        with ProcessPoolExecutor(max_workers=min(len(_FIGURE_SPECS), os.cpu_count() or 1)) as pool:
+            rendering = [pool.submit(render_figure, spec) for spec in _FIGURE_SPECS]
+            for future, spec in zip(rendering, _FIGURE_SPECS):
+                future.result()
+                print(f"✓ {spec['message']}")
     
     print("\nAll figures generated successfully!")
\ No newline at end of file